@@ -1,30 +1,426 @@
 import argparse
 import json
 import csv
-import xml.etree.ElementTree as ET
 import re
 import logging
 import random
+import sys
 from faker import Faker
 import os
+import ast
+import mmap
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+try:
+    # NumPy draws batches of random integers in C instead of one Python call per value
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # pandas is only needed for the column-at-a-time CSV path
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    # rstr generates random strings matching arbitrary regex rules
+    import rstr
+except ImportError:
+    rstr = None
+
+try:
+    # Optional Cython build of the row loop (cythonize -i _anonymize_core.pyx)
+    from _anonymize_core import anonymize_rows as _anonymize_rows
+except ImportError:
+    _anonymize_rows = None
+
+try:
+    # lxml wraps libxml2 and parses/serializes considerably faster than the pure-Python ElementTree
+    from lxml import etree as ET
+    _HAVE_LXML = True
+    _XML_PARSE_OPTIONS = {'huge_tree': True, 'remove_blank_text': False}
+    # lxml keeps comments and processing instructions in the tree, so the streaming writer has to emit them too
+    _XML_STREAM_EVENTS = ("start", "end", "comment", "pi")
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+    _XML_PARSE_OPTIONS = {}
+    _XML_STREAM_EVENTS = ("start", "end")
+
+try:
+    # orjson parses and serializes JSON several times faster than the stdlib module
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # ijson parses top-level JSON arrays one record at a time
+    import ijson
+except ImportError:
+    ijson = None
+
+# Inputs smaller than this are read in one call; memory-mapping them is not worth the overhead
+_MMAP_THRESHOLD = 64 * 1024
+
+# JSON arrays at least this large are streamed record by record when ijson is installed
+_JSON_STREAM_THRESHOLD = 64 * 1024 * 1024
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Built-in regex rules mapped to the Faker method that generates a matching value.
+_REGEX_RULE_TABLE = {
+    r"^\d{3}-\d{2}-\d{4}$": "ssn",  # Example: Social Security Number
+    r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$": "email",  # Example: Email
+    r"^\d{10}$": "phone_number",  # Example: Phone number
+}
+
+# A run of 19 digits may be an integer outside the 64-bit range, which orjson would turn into a float.
+_WIDE_INT_RE = re.compile(rb"\d{19}")
+
+# Matches "random.<function>(<args>)" rules, e.g. "random.choice(['a', 'b'])".
+_RANDOM_RULE_RE = re.compile(r"^random\.(\w+)\((.*)\)$")
+
+# Functions of the random module that random.* rules may call. Anything that changes generator state
+# (seed, setstate, ...) or does not return a value (shuffle) is deliberately left out.
+_RANDOM_RULE_FUNCTIONS = frozenset({
+    "random", "uniform", "triangular", "randint", "randrange", "getrandbits", "choice", "choices", "sample",
+    "gauss", "normalvariate", "lognormvariate", "expovariate", "vonmisesvariate", "gammavariate",
+    "betavariate", "paretovariate", "weibullvariate",
+})
+
+
+@lru_cache(maxsize=None)
+def _compile_regex(regex_pattern):
+    """
+    Compiles a regex pattern once and caches the result for later lookups.
+
+    Args:
+        regex_pattern (str): The regex pattern to compile.
+
+    Returns:
+        re.Pattern: The compiled pattern.
+    """
+    return re.compile(regex_pattern)
+
+
+def _open_mmap(path):
+    """
+    Memory-maps a file read-only so that its contents are paged in on demand rather than copied.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        mmap.mmap: The read-only memory map. The caller is responsible for closing it.
+    """
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _json_loads(data):
+    """
+    Parses JSON with orjson when it is installed and can represent the document exactly.
+
+    Documents with integers wider than 64 bits, or that orjson rejects (e.g. NaN or Infinity),
+    are parsed with the stdlib json module so that pass-through values are preserved.
+
+    Args:
+        data (bytes or memoryview): The JSON document.
+
+    Returns:
+        tuple: The parsed data and True if orjson parsed it, False if the stdlib json module did.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None and not _WIDE_INT_RE.search(data):
+        try:
+            return orjson.loads(data), True
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(bytes(data)), False
+
+
+def _json_dumps(obj, use_orjson=True):
+    """
+    Serializes JSON output with two-space indentation.
+
+    Args:
+        obj: The data to serialize.
+        use_orjson (bool, optional): Whether orjson may be used; pass False for data parsed by the
+            stdlib json module, which orjson could not round-trip. Defaults to True.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    if orjson is not None and use_orjson:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers wider than 64 bits, which the stdlib module can encode
+    return json.dumps(obj, indent=2).encode('utf8')
+
+
+def _load_json_file(path):
+    """
+    Parses a JSON file, memory-mapping large inputs when orjson is available to avoid an extra copy.
+
+    Args:
+        path (str): Path to the JSON file.
+
+    Returns:
+        tuple: The parsed data and True if orjson parsed it (see _json_loads).
+    """
+    if orjson is None or os.path.getsize(path) < _MMAP_THRESHOLD:
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
+    with _open_mmap(path) as mm, memoryview(mm) as view:
+        return _json_loads(view)
+
+
+@contextmanager
+def _replace_on_success(path):
+    """
+    Provides a temporary path next to the output file that replaces it only if the block completes.
+
+    On error the temporary file is removed and any existing output file is left untouched.
+
+    Args:
+        path (str): Path to the final output file.
+
+    Yields:
+        str: Path to write the output to.
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        yield temp_path
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _is_json_array(path):
+    """
+    Checks whether a JSON file holds a top-level array by looking at its first non-whitespace byte.
+
+    Args:
+        path (str): Path to the JSON file.
+
+    Returns:
+        bool: True if the document starts with '['.
+    """
+    with open(path, 'rb') as f:
+        return f.read(4096).lstrip().startswith(b'[')
+
+
+class _ChunkedWriter:
+    """
+    File writer that accumulates output in memory and hands it to the OS in large chunks.
+    """
+
+    def __init__(self, path, chunk_size=1 << 20, encoding='utf8'):
+        """
+        Opens (or truncates) the output file.
+
+        Args:
+            path (str): Path to the output file.
+            chunk_size (int, optional): Buffered bytes that trigger a write. Defaults to 1 MiB.
+            encoding (str, optional): Encoding used for str data. Defaults to 'utf8'.
+        """
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self._buffer = bytearray()
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+
+    def write(self, data):
+        """
+        Buffers data, writing the buffer out once it reaches the chunk size.
+
+        Args:
+            data (str or bytes): The data to write; str is encoded with the writer's encoding.
+        """
+        if isinstance(data, str):
+            data = data.encode(self.encoding)
+        self._buffer += data
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all buffered data to the file.
+        """
+        with memoryview(self._buffer) as view:
+            written = 0
+            while written < len(view):
+                written += os.write(self._fd, view[written:])
+        del self._buffer[:]
+
+    def close(self):
+        """
+        Flushes any buffered data and closes the file.
+        """
+        try:
+            self.flush()
+        finally:
+            os.close(self._fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class _BatchedProvider:
+    """
+    Wraps a value generator and hands out values from a buffer that is refilled in batches.
+    """
+
+    def __init__(self, generate_batch, batch=1024, randint_bounds=None):
+        """
+        Initializes the provider.
+
+        Args:
+            generate_batch (callable): Function taking a batch size and returning that many values.
+            batch (int, optional): Number of values generated per refill. Defaults to 1024.
+            randint_bounds (tuple, optional): (low, high) of a compiled random.randint rule, letting
+                column-at-a-time callers draw a whole column at once. Defaults to None.
+        """
+        self.generate_batch = generate_batch
+        self.batch = batch
+        self.randint_bounds = randint_bounds
+        self._buffer = deque()
+
+    @classmethod
+    def from_method(cls, method, transform=None, batch=1024):
+        """
+        Creates a provider that refills its buffer by calling a single-value method repeatedly.
+
+        Args:
+            method (callable): Function taking no arguments that returns one value (e.g., a Faker method).
+            transform (callable, optional): Conversion applied to each generated value (e.g., str). Defaults to None.
+            batch (int, optional): Number of values generated per refill. Defaults to 1024.
+
+        Returns:
+            _BatchedProvider: The batched provider.
+        """
+        if transform is None:
+            return cls(lambda size: [method() for _ in range(size)], batch)
+        return cls(lambda size: [transform(method()) for _ in range(size)], batch)
+
+    def __call__(self):
+        if not self._buffer:
+            self._buffer = deque(self.generate_batch(self.batch))
+        return self._buffer.popleft()
+
+
+def _parse_randint(rule):
+    """
+    Extracts the bounds of a "random.randint(a, b)" rule.
+
+    Args:
+        rule (str): The masking rule.
+
+    Returns:
+        tuple: The (low, high) bounds, or None if the rule is not a randint rule.
+
+    Raises:
+        ValueError: If the bounds are not two integers or describe an empty range.
+    """
+    if not (isinstance(rule, str) and rule.startswith("random.randint(") and rule.endswith(")")):
+        return None
+    bounds = ast.literal_eval(rule[15:-1])
+    if not (isinstance(bounds, tuple) and len(bounds) == 2 and all(isinstance(bound, int) for bound in bounds)):
+        raise ValueError("randint expects two integer bounds")
+    low, high = bounds
+    if low > high:
+        raise ValueError(f"empty range for randint({low}, {high})")
+    return low, high
+
+
+def _numpy_randint_supported(low, high):
+    """
+    Checks whether NumPy can draw integers in [low, high], which requires both bounds to fit in int64.
+
+    Args:
+        low (int): Lower bound (inclusive).
+        high (int): Upper bound (inclusive).
+
+    Returns:
+        bool: True if NumPy is installed and the bounds fit.
+    """
+    if np is None:
+        return False
+    int64 = np.iinfo(np.int64)
+    return int64.min <= low and high < int64.max  # high + 1 is passed as the exclusive bound
+
+
+def _randint_batch(low, high):
+    """
+    Returns a batch generator of random integers in [low, high] formatted as strings, using NumPy when it can represent the bounds.
+
+    Args:
+        low (int): Lower bound (inclusive).
+        high (int): Upper bound (inclusive).
+
+    Returns:
+        callable: Function taking a batch size and returning that many integer strings.
+    """
+    if _numpy_randint_supported(low, high):
+        return lambda size: np.random.randint(low, high + 1, size=size).astype(str).tolist()
+    return lambda size: [str(random.randint(low, high)) for _ in range(size)]
+
+
 class DataAnonymizer:
     """
     Anonymizes structured data formats (JSON, CSV, XML) by applying configurable masking rules to specific fields.
     """
 
-    def __init__(self, config_file=None):
+    def __init__(self, config_file=None, config=None, locale='en_US', seed=None):
         """
         Initializes the DataAnonymizer with an optional configuration file.
 
         Args:
             config_file (str, optional): Path to the configuration file. Defaults to None.
+            config (dict, optional): Anonymization rules, used when no configuration file is given. Defaults to None.
+            locale (str, optional): Single Faker locale used to generate values. Defaults to 'en_US'.
+            seed (int, optional): Seed for reproducible output. Defaults to None.
+        """
+        self.config = self._load_config(config_file) if config_file else (config or {})
+        self.locale = locale
+        # Faker generates values for the requested locale (--locale); --seed makes them reproducible below
+        self.fake = Faker(locale=locale)
+        self._regex_dispatch = {pattern: getattr(self.fake, method) for pattern, method in _REGEX_RULE_TABLE.items()}
+        if seed is not None:
+            self.seed(seed)
+        else:
+            self._compiled_config = self._compile_config(self.config)
+            self._rule_items_cache = {}
+
+    def seed(self, seed):
+        """
+        Seeds Faker and the random generators so that subsequent output is reproducible.
+
+        Args:
+            seed (int): The seed value.
         """
-        self.config = self._load_config(config_file) if config_file else {}
-        self.fake = Faker()
+        self.fake.seed_instance(seed)
+        random.seed(seed)
+        if np is not None:
+            np.random.seed(seed % 2**32)
+        # Recompile so that values buffered under the previous seed are discarded
+        self._compiled_config = self._compile_config(self.config)
+        self._rule_items_cache = {}
 
     def _load_config(self, config_file):
         """
@@ -52,19 +448,146 @@ class DataAnonymizer:
             logging.error(f"Invalid JSON in configuration file: {e}")
             raise
 
+    def _compile_config(self, config):
+        """
+        Compiles the masking rules once into a table of callables keyed by field name.
+
+        Args:
+            config (dict): Anonymization rules.
+
+        Returns:
+            dict: Mapping of field name to a callable producing the anonymized value.
+        """
+        # Interned field names let lookups against other interned keys succeed on the identity check
+        return {sys.intern(field) if isinstance(field, str) else field: self._compile_rule(rule) for field, rule in config.items() if rule}
+
+    def _get_compiled_config(self, config):
+        """
+        Returns the compiled action table for the given configuration, reusing the class one when possible.
+
+        Args:
+            config (dict, optional): Anonymization rules. Defaults to the class configuration.
+
+        Returns:
+            dict: Mapping of field name to a callable producing the anonymized value.
+        """
+        if not config or config is self.config:
+            return self._compiled_config
+        return self._compile_config(config)
+
+    def _compile_rule(self, rule):
+        """
+        Compiles a single masking rule into a callable, validating it by generating one value.
+
+        Args:
+            rule (str): The masking rule to compile (e.g., "fake.name", "random.randint(1000, 9999)").
+
+        Returns:
+            callable: A function taking no arguments that returns the anonymized value.
+        """
+        try:
+            if rule.startswith("fake."):
+                fake_method = getattr(self.fake, rule[5:])
+                # Most providers already return str, so only the others get a str() conversion
+                action = _BatchedProvider.from_method(fake_method, None if isinstance(fake_method(), str) else str)
+            elif bounds := _parse_randint(rule):
+                action = _BatchedProvider(_randint_batch(*bounds), randint_bounds=bounds)
+            elif rule.startswith("random."):
+                random_function, args = self._parse_random_rule(rule)
+                action = lambda: str(random_function(*args))
+            elif rule == "null":
+                action = lambda: None  # Or use "null" string representation
+            elif rule.startswith("regex:"):
+                # Extract the regex and generate a masked value based on the regex pattern
+                action = self._compile_regex_rule(rule[6:])
+            else:
+                action = lambda: rule  # Use the rule as a literal value
+            # Invoke the rule once so that errors surface here instead of on every value
+            action()
+        except Exception as e:
+            logging.error(f"Invalid masking rule '{rule}': {e}")
+            return lambda: "[MASKING_ERROR]"  # Return an error indicator
+        return action
+
+    def _parse_random_rule(self, rule):
+        """
+        Parses a "random.<function>(<args>)" rule without evaluating it as code.
+
+        Args:
+            rule (str): The masking rule to parse (e.g., "random.choice(['a', 'b'])").
+
+        Returns:
+            tuple: The function from the random module and a tuple of literal arguments.
+
+        Raises:
+            ValueError: If the rule is malformed, names a function outside the allowlist or has non-literal arguments.
+        """
+        match = _RANDOM_RULE_RE.match(rule)
+        if not match:
+            raise ValueError("expected random.<function>(<args>)")
+        name, arg_string = match.groups()
+        if name not in _RANDOM_RULE_FUNCTIONS:
+            raise ValueError(f"unsupported random function '{name}'")
+        random_function = getattr(random, name)
+        args = ast.literal_eval(f"({arg_string},)") if arg_string.strip() else ()
+        return random_function, args
+
     def anonymize_json(self, data, config=None):
         """
         Anonymizes JSON data based on the provided configuration or the class configuration.
 
         Args:
-            data (dict): The JSON data to anonymize.
+            data (dict or list of dict): The JSON data to anonymize.
             config (dict, optional): Anonymization rules. Defaults to None.
 
         Returns:
-            dict: The anonymized JSON data.
+            dict or list of dict: The anonymized JSON data.
         """
-        config = config or self.config
-        return self._anonymize_data(data, config)
+        compiled = self._get_compiled_config(config)
+        if isinstance(data, list):
+            return [self._anonymize_data(record, compiled) for record in data]
+        return self._anonymize_data(data, compiled)
+
+    def anonymize_json_stream(self, input_path, output_path, config=None):
+        """
+        Anonymizes a JSON file holding a top-level array, reading and writing one record at a time.
+
+        Memory use stays proportional to the largest record rather than the whole file. The output
+        layout matches the whole-file path, and it replaces the output file only once the input has
+        been read completely. Input the streaming parser rejects but the whole-file parser accepts
+        (integers outside int64, NaN) is anonymized by parsing the whole file instead.
+
+        Args:
+            input_path (str): Path to the input JSON file.
+            output_path (str): Path to the output JSON file.
+            config (dict, optional): Anonymization rules. Defaults to None.
+
+        Raises:
+            ImportError: If ijson is not installed.
+            json.JSONDecodeError: If the input file is not valid JSON.
+        """
+        if ijson is None:
+            raise ImportError("ijson is required for anonymize_json_stream")
+        compiled = self._get_compiled_config(config)
+        try:
+            with open(input_path, 'rb') as fin, _replace_on_success(output_path) as temp_path, _ChunkedWriter(temp_path) as fout:
+                separator = b"[\n  "
+                for record in ijson.items(fin, 'item', use_float=True):
+                    fout.write(separator)
+                    # Indent each record one level so the array reads exactly like _json_dumps output
+                    fout.write(_json_dumps(self._anonymize_data(record, compiled)).replace(b"\n", b"\n  "))
+                    separator = b",\n  "
+                fout.write(b"[]" if separator == b"[\n  " else b"\n]")
+            return
+        except ijson.JSONError as e:
+            logging.warning(f"Streaming JSON parser failed ({e}); parsing the whole file instead")
+        try:
+            data, parsed_with_orjson = _load_json_file(input_path)
+        except json.JSONDecodeError as e:
+            logging.error(f"Error decoding JSON from input file: {e}")
+            raise
+        with _replace_on_success(output_path) as temp_path, open(temp_path, 'wb') as f:
+            f.write(_json_dumps(self.anonymize_json(data, config), parsed_with_orjson))
 
     def anonymize_csv(self, data, config=None):
         """
@@ -77,12 +600,125 @@ class DataAnonymizer:
         Returns:
             list of dict: The anonymized CSV data.
         """
-        config = config or self.config
+        compiled = self._get_compiled_config(config)
+        if _anonymize_rows is not None and isinstance(data, list):
+            return _anonymize_rows(data, compiled, self._rule_items)
         anonymized_data = []
         for row in data:
-            anonymized_data.append(self._anonymize_data(row, config))
+            anonymized_data.append(self._anonymize_data(row, compiled))
         return anonymized_data
 
+    def anonymize_csv_parallel(self, rows, n_workers=None, chunk_size=10000, seed=None):
+        """
+        Anonymizes a list of rows (CSV rows or JSON records) in parallel across worker processes.
+
+        The rows are split into chunks that are anonymized by a pool of processes, each holding its own
+        DataAnonymizer built from this instance's configuration.
+
+        Args:
+            rows (list of dict): The rows to anonymize.
+            n_workers (int, optional): Number of worker processes. Defaults to os.cpu_count().
+            chunk_size (int, optional): Number of rows per chunk. Defaults to 10000.
+            seed (int, optional): Base seed; chunk i is anonymized with seed + i for reproducible output.
+                Defaults to None, in which case each chunk gets a fresh seed from the system RNG.
+
+        Returns:
+            list of dict: The anonymized rows, in input order.
+        """
+        chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+        n_workers = n_workers or os.cpu_count() or 1
+        if len(chunks) <= 1 or n_workers == 1:
+            anonymized_rows = []
+            for i, chunk in enumerate(chunks):
+                if seed is not None:
+                    self.seed(seed + i)
+                anonymized_rows.extend(self.anonymize_csv(chunk))
+            return anonymized_rows
+        if seed is None:
+            # Forked workers inherit identical generator states, so unseeded runs still need a distinct seed per chunk
+            system_random = random.SystemRandom()
+            seeds = [system_random.getrandbits(64) for _ in chunks]
+        else:
+            seeds = [seed + i for i in range(len(chunks))]
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(self.config, self.locale)) as executor:
+            results = executor.map(_anonymize_chunk, chunks, seeds, chunksize=1)
+            return [row for chunk in results for row in chunk]
+
+    def anonymize_csv_stream(self, input_path, output_path, config=None):
+        """
+        Anonymizes a CSV file row by row, writing each row as soon as it is read.
+
+        Args:
+            input_path (str): Path to the input CSV file.
+            output_path (str): Path to the output CSV file.
+            config (dict, optional): Anonymization rules. Defaults to None.
+        """
+        config = config or self.config
+        compiled = self._get_compiled_config(config)
+        # The output replaces output_path only once the whole input has been read, so it may be the input file itself
+        with _replace_on_success(output_path) as temp_path, open(input_path, 'r', newline='') as fin, _ChunkedWriter(temp_path) as fout:
+            reader = csv.reader(fin)
+            writer = csv.writer(fout)
+            header = next(reader, None)
+            if header is None:
+                return
+            header = [sys.intern(column) for column in header]
+            writer.writerow(header)
+            # csv.writer writes None as an empty field, so null rules can produce "" and keep every field a str
+            rule_cols = [((lambda: "") if config.get(column) == "null" else action, index) for index, column in enumerate(header) if (action := compiled.get(column))]
+            width = len(header)
+            lineterminator = writer.dialect.lineterminator
+            write = fout.write
+            for row in reader:
+                if not row:
+                    continue  # Blank lines are skipped, as csv.DictReader does
+                # Only the configured columns are overwritten; every other field is passed through untouched
+                if len(row) >= width:
+                    for action, index in rule_cols:
+                        row[index] = action()
+                else:
+                    for action, index in rule_cols:
+                        if index < len(row):
+                            row[index] = action()
+                line = ",".join(row)
+                # Rows with no delimiter, quote or line break inside a field need no quoting and bypass csv.writer
+                if len(row) > 1 and line.count(",") == len(row) - 1 and '"' not in line and "\n" not in line and "\r" not in line:
+                    write(line + lineterminator)
+                else:
+                    writer.writerow(row)
+
+    def anonymize_csv_pandas(self, input_path, output_path, config=None):
+        """
+        Anonymizes a CSV file with pandas, generating each configured column in one pass.
+
+        Args:
+            input_path (str): Path to the input CSV file.
+            output_path (str): Path to the output CSV file.
+            config (dict, optional): Anonymization rules. Defaults to None.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        if pd is None:
+            raise ImportError("pandas is required for anonymize_csv_pandas")
+        config = config or self.config
+        compiled = self._get_compiled_config(config)
+        df = pd.read_csv(input_path, dtype=str, keep_default_na=False)
+        size = len(df)
+        for column, action in compiled.items():
+            if column not in df.columns:
+                continue
+            rule = config[column]
+            # Only randint rules that compiled successfully carry their bounds
+            bounds = getattr(action, 'randint_bounds', None)
+            if bounds and _numpy_randint_supported(*bounds):
+                df[column] = np.random.randint(bounds[0], bounds[1] + 1, size=size).astype(str)
+            elif not isinstance(rule, str) or rule == "null" or not rule.startswith(("fake.", "random.", "regex:")):
+                df[column] = action()  # Constant rule, broadcast to the whole column
+            else:
+                df[column] = [action() for _ in range(size)]
+        df.to_csv(output_path, index=False)
+
     def anonymize_xml(self, xml_string, config=None):
          """
          Anonymizes XML data based on the provided configuration or the class configuration.
@@ -94,103 +730,203 @@ class DataAnonymizer:
          Returns:
              str: The anonymized XML data as a string.
          """
-         config = config or self.config
+         compiled = self._get_compiled_config(config)
          try:
-             root = ET.fromstring(xml_string)
-             self._anonymize_xml_element(root, config)
-             return ET.tostring(root, encoding='utf8').decode('utf8')
+             parser_options = dict(_XML_PARSE_OPTIONS)
+             if _HAVE_LXML and isinstance(xml_string, str):
+                 # lxml refuses str input with an encoding declaration; encode it and override the declared encoding
+                 xml_string = xml_string.encode('utf8')
+                 parser_options['encoding'] = 'utf-8'
+             root = ET.fromstring(xml_string, ET.XMLParser(**parser_options))
+             elements = root.iter()
+             next(elements)  # The root element itself is never masked
+             for element in elements:
+                 action = compiled.get(element.tag)
+                 if action:
+                     element.text = action()
+             return ET.tostring(root, encoding='unicode')
          except ET.ParseError as e:
              logging.error(f"Error parsing XML: {e}")
              raise
 
-    def _anonymize_xml_element(self, element, config):
+    def anonymize_xml_stream(self, input_path, output_path, config=None):
         """
-        Recursively anonymizes an XML element based on the configuration.
+        Anonymizes an XML file incrementally, writing each top-level child of the root as soon as it is parsed.
+
+        Memory use stays proportional to the largest top-level child rather than the whole document.
 
         Args:
-            element (xml.etree.ElementTree.Element): The XML element to anonymize.
-            config (dict): Anonymization rules.
+            input_path (str): Path to the input XML file.
+            output_path (str): Path to the output XML file.
+            config (dict, optional): Anonymization rules. Defaults to None.
         """
-        for child in element:
-            if child.tag in config:
-                rule = config[child.tag]
-                child.text = self._apply_masking_rule(rule)
-            self._anonymize_xml_element(child, config)
+        compiled = self._get_compiled_config(config)
+        root = None
+        shell = None
+        pending = None  # Written once its tail text has been parsed
+        opening_tag = closing_tag = ""
+        depth = 0
+        try:
+            with _replace_on_success(output_path) as temp_path, open(temp_path, 'w', encoding='utf8') as f:
 
+                def write_node(node):
+                    # Writes a finished top-level node and detaches it from the root to free its memory
+                    if _HAVE_LXML:
+                        # Serializing inside the root shell keeps lxml from redeclaring the root's namespaces
+                        shell.append(node)
+                        text = ET.tostring(shell, encoding='unicode')
+                        shell.remove(node)
+                        f.write(text[len(opening_tag):-len(closing_tag)])
+                    else:
+                        f.write(ET.tostring(node, encoding='unicode'))
+                        root.remove(node)
 
+                f.write("<?xml version='1.0' encoding='utf8'?>\n")
+                for event, element in ET.iterparse(input_path, events=_XML_STREAM_EVENTS, **_XML_PARSE_OPTIONS):
+                    if event in ("comment", "pi"):
+                        # Top-level comments and processing instructions are written in document order like elements
+                        if depth == 1:
+                            if pending is not None:
+                                write_node(pending)
+                            elif root.text:
+                                f.write(escape(root.text))
+                            pending = element
+                        continue
+                    if event == "start":
+                        depth += 1
+                        if root is None:
+                            root = element
+                            if _HAVE_LXML:
+                                shell = ET.Element(root.tag, dict(root.attrib), nsmap=root.nsmap)
+                            else:
+                                shell = ET.Element(root.tag, dict(root.attrib))
+                            shell.text = " "
+                            serialized = ET.tostring(shell, encoding='unicode')
+                            shell.text = None
+                            split = serialized.rindex(" </")
+                            opening_tag, closing_tag = serialized[:split], serialized[split + 1:]
+                            f.write(opening_tag)
+                        continue
+                    depth -= 1
+                    if element is root:
+                        break
+                    action = compiled.get(element.tag)
+                    if action:
+                        element.text = action()
+                    if depth == 1:
+                        if pending is not None:
+                            write_node(pending)
+                        elif root.text:
+                            f.write(escape(root.text))
+                        pending = element
+                if pending is not None:
+                    write_node(pending)
+                elif root is not None and root.text:
+                    f.write(escape(root.text))
+                if root is not None:
+                    f.write(closing_tag)
+        except ET.ParseError as e:
+            logging.error(f"Error parsing XML: {e}")
+            raise
 
-    def _anonymize_data(self, data, config):
+    def _anonymize_data(self, data, compiled):
         """
         Anonymizes a dictionary (used for both JSON and CSV rows) based on the configuration.
 
         Args:
             data (dict): The data to anonymize.
-            config (dict): Anonymization rules.
+            compiled (dict): Compiled anonymization rules.
 
         Returns:
             dict: The anonymized data.
         """
-        anonymized_data = {}
-        for key, value in data.items():
-            rule = config.get(key)
-            if rule:
-                anonymized_data[key] = self._apply_masking_rule(rule)
-            else:
-                anonymized_data[key] = value  # Keep original value if no rule is defined
+        # Copy the record and overwrite only the configured fields; records without any are plain copies
+        anonymized_data = data.copy()
+        for key, action in self._rule_items(data, compiled):
+            anonymized_data[key] = action()
         return anonymized_data
 
-    def _apply_masking_rule(self, rule):
+    def _rule_items(self, data, compiled):
         """
-        Applies a specific masking rule based on the configuration.
+        Returns the compiled rules that apply to a record, cached per record schema for the class configuration.
 
         Args:
-            rule (str): The masking rule to apply (e.g., "fake.name", "random.randint(1000, 9999)").
+            data (dict): The record being anonymized.
+            compiled (dict): Compiled anonymization rules.
 
         Returns:
-            str: The anonymized value.
+            tuple: (field name, action) pairs for the configured fields present in the record, in rule order.
         """
+        if compiled is not self._compiled_config:
+            return tuple((key, action) for key, action in compiled.items() if key in data)
+        schema = tuple(data)
+        rule_items = self._rule_items_cache.get(schema)
+        if rule_items is None:
+            rule_items = tuple((key, action) for key, action in compiled.items() if key in data)
+            if len(self._rule_items_cache) < 1024:  # Bound the cache for inputs with highly variable schemas
+                self._rule_items_cache[schema] = rule_items
+        return rule_items
+
+    def _compile_regex_rule(self, regex_pattern):
+        """
+        Compiles a regex rule into a callable generating a masked value that matches the pattern.
+
+        Built-in patterns use the matching Faker method. Other patterns are validated once and, when rstr
+        is installed, generate a random matching string (rstr parses the pattern on every call); otherwise
+        they produce a default masked value.
+
+        Args:
+            regex_pattern (str): The regex pattern to generate masked values for.
+
+        Returns:
+            callable: A function taking no arguments that returns the masked value.
+        """
+        generator = self._regex_dispatch.get(regex_pattern)
+        if generator:
+            return generator
         try:
-            if rule.startswith("fake."):
-                fake_attribute = rule[5:]
-                return str(getattr(self.fake, fake_attribute)())
-            elif rule.startswith("random."):
-                # Execute random function using eval (use with caution!)
-                return str(eval(rule))
-            elif rule == "null":
-                return None  # Or use "null" string representation
-            elif rule.startswith("regex:"):
-                # Extract the regex and generate a masked value based on the regex pattern
-                regex_pattern = rule[6:]
-                return self._generate_masked_value_from_regex(regex_pattern)
-            else:
-                return rule  # Use the rule as a literal value
-        except Exception as e:
-            logging.error(f"Error applying masking rule '{rule}': {e}")
-            return "[MASKING_ERROR]"  # Return an error indicator
+            _compile_regex(regex_pattern)
+        except re.error as e:
+            logging.warning(f"Invalid regex pattern '{regex_pattern}': {e}")
+            return lambda: "[MASKED_VALUE]"
+        if rstr is None:
+            # If the regex pattern is not recognized, return a default masked value
+            return lambda: "[MASKED_VALUE]"
+        return lambda: rstr.xeger(regex_pattern)
 
-    def _generate_masked_value_from_regex(self, regex_pattern):
-      """
-      Generates a masked value based on the provided regex pattern.
 
-      Args:
-          regex_pattern (str): The regex pattern to generate a masked value for.
 
-      Returns:
-          str: The masked value.
-      """
-      # Generate a placeholder based on the regex.  This is a simple example and 
-      # can be expanded to handle more complex regex patterns.
-      if regex_pattern == r"^\d{3}-\d{2}-\d{4}$":  # Example: Social Security Number
-          return self.fake.ssn()
-      elif regex_pattern == r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$": #Example: Email
-          return self.fake.email()
-      elif regex_pattern == r"^\d{10}$":  # Example: Phone number
-          return self.fake.phone_number()
+# DataAnonymizer owned by the current worker process, created once by _init_worker
+_worker_anonymizer = None
 
-      else:
-          # If the regex pattern is not recognized, return a default masked value
-          return "[MASKED_VALUE]"
 
+def _init_worker(config, locale):
+    """
+    Creates the DataAnonymizer for a worker process. Faker instances are not picklable, so each
+    process builds its own from the configuration dictionary.
+
+    Args:
+        config (dict): Anonymization rules.
+        locale (str): Faker locale.
+    """
+    global _worker_anonymizer
+    _worker_anonymizer = DataAnonymizer(config=config, locale=locale)
+
+
+def _anonymize_chunk(chunk, seed):
+    """
+    Anonymizes one chunk of rows with the worker process's DataAnonymizer.
+
+    Args:
+        chunk (list of dict): The rows to anonymize.
+        seed (int): Seed for this chunk, or None to leave the generators unseeded.
+
+    Returns:
+        list of dict: The anonymized rows.
+    """
+    if seed is not None:
+        _worker_anonymizer.seed(seed)
+    return _worker_anonymizer.anonymize_csv(chunk)
 
 
 def setup_argparse():
@@ -205,6 +941,8 @@ def setup_argparse():
     parser.add_argument('output_file', help='Path to the output file.')
     parser.add_argument('--config', help='Path to the configuration file (JSON).', required=True)
     parser.add_argument('--format', choices=['json', 'csv', 'xml'], required=True, help='Data format (json, csv, xml).')
+    parser.add_argument('--locale', default='en_US', help='Faker locale used to generate values (default: en_US).')
+    parser.add_argument('--seed', type=int, help='Seed for reproducible output.')
     return parser
 
 def main():
@@ -215,38 +953,38 @@ def main():
     args = parser.parse_args()
 
     try:
-        anonymizer = DataAnonymizer(args.config)
-
-        with open(args.input_file, 'r') as f:
-            if args.format == 'json':
-                try:
-                    data = json.load(f)
-                    anonymized_data = anonymizer.anonymize_json(data)
-                except json.JSONDecodeError as e:
-                    logging.error(f"Error decoding JSON from input file: {e}")
-                    print(f"Error decoding JSON from input file: {e}")
-                    return
-            elif args.format == 'csv':
-                reader = csv.DictReader(f)
-                data = list(reader)
-                anonymized_data = anonymizer.anonymize_csv(data)
-            elif args.format == 'xml':
-                xml_string = f.read()
-                anonymized_data = anonymizer.anonymize_xml(xml_string)
-            else:
-                print("Unsupported format.")
-                return
+        anonymizer = DataAnonymizer(args.config, locale=args.locale, seed=args.seed)
+
+        if args.format == 'xml':
+            anonymizer.anonymize_xml_stream(args.input_file, args.output_file)
+            logging.info(f"Anonymized data written to {args.output_file}")
+            print(f"Anonymized data written to {args.output_file}")
+            return
 
-        with open(args.output_file, 'w') as f:
-            if args.format == 'json':
-                json.dump(anonymized_data, f, indent=4)
-            elif args.format == 'csv':
-                if anonymized_data:
-                    writer = csv.DictWriter(f, fieldnames=anonymized_data[0].keys())
-                    writer.writeheader()
-                    writer.writerows(anonymized_data)
-            elif args.format == 'xml':
-                f.write(anonymized_data)
+        if args.format == 'json' and ijson is not None and os.path.getsize(args.input_file) >= _JSON_STREAM_THRESHOLD and _is_json_array(args.input_file):
+            try:
+                anonymizer.anonymize_json_stream(args.input_file, args.output_file)
+            except json.JSONDecodeError as e:
+                print(f"Error decoding JSON from input file: {e}")
+                return
+        elif args.format == 'json':
+            try:
+                data, parsed_with_orjson = _load_json_file(args.input_file)
+            except json.JSONDecodeError as e:
+                logging.error(f"Error decoding JSON from input file: {e}")
+                print(f"Error decoding JSON from input file: {e}")
+                return
+            if isinstance(data, list):
+                anonymized_data = anonymizer.anonymize_csv_parallel(data, seed=args.seed)
+            else:
+                anonymized_data = anonymizer.anonymize_json(data)
+            with open(args.output_file, 'wb') as f:
+                f.write(_json_dumps(anonymized_data, parsed_with_orjson))
+        elif args.format == 'csv':
+            anonymizer.anonymize_csv_stream(args.input_file, args.output_file)
+        else:
+            print("Unsupported format.")
+            return
 
         logging.info(f"Anonymized data written to {args.output_file}")
         print(f"Anonymized data written to {args.output_file}")
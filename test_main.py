@@ -0,0 +1,228 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import main
+from main import DataAnonymizer
+
+
+class AnonymizeCsvParallelTest(unittest.TestCase):
+
+    def test_unseeded_chunks_differ(self):
+        anonymizer = DataAnonymizer(config={"name": "fake.name", "id": "random.randint(0, 1000000000)"})
+        rows = [{"name": "x", "id": "0"} for _ in range(400)]
+        anonymized = anonymizer.anonymize_csv_parallel(rows, n_workers=4, chunk_size=100)
+        chunks = [anonymized[i:i + 100] for i in range(0, len(anonymized), 100)]
+        self.assertEqual(len(anonymized), len(rows))
+        self.assertEqual(len({tuple(row["id"] for row in chunk) for chunk in chunks}), len(chunks))
+
+    def test_seeded_output_is_reproducible(self):
+        anonymizer = DataAnonymizer(config={"name": "fake.name"})
+        rows = [{"name": "x"} for _ in range(300)]
+        parallel = anonymizer.anonymize_csv_parallel(rows, n_workers=3, chunk_size=100, seed=7)
+        serial = anonymizer.anonymize_csv_parallel(rows, n_workers=1, chunk_size=100, seed=7)
+        self.assertEqual(parallel, serial)
+
+
+
+class RandintRuleTest(unittest.TestCase):
+
+    def test_invalid_bounds_are_masking_errors(self):
+        for rule in ("random.randint(1.5, 3)", "random.randint(5)", "random.randint(10, 1)", "random.randint('1', 2)"):
+            with self.subTest(rule=rule):
+                self.assertEqual(DataAnonymizer(config={"a": rule}).anonymize_json({"a": 0}), {"a": "[MASKING_ERROR]"})
+
+    def test_bounds_outside_int64(self):
+        value = DataAnonymizer(config={"a": "random.randint(0, 99999999999999999999)"}).anonymize_json({"a": 0})["a"]
+        self.assertTrue(0 <= int(value) <= 99999999999999999999)
+
+
+class RandomRuleTest(unittest.TestCase):
+
+    def test_allowed_functions_generate_values(self):
+        anonymized = DataAnonymizer(config={"a": "random.choice(['x', 'y'])", "b": "random.uniform(1, 2)"}).anonymize_json({"a": 0, "b": 0})
+        self.assertIn(anonymized["a"], ("x", "y"))
+        self.assertTrue(1 <= float(anonymized["b"]) <= 2)
+
+    def test_other_functions_are_masking_errors(self):
+        for rule in ("random.seed(1)", "random.setstate(None)", "random.shuffle([1, 2])", "random.__class__()"):
+            with self.subTest(rule=rule):
+                self.assertEqual(DataAnonymizer(config={"a": rule}).anonymize_json({"a": 0}), {"a": "[MASKING_ERROR]"})
+
+
+class AnonymizeCsvStreamTest(unittest.TestCase):
+
+    def test_output_matches_csv_writer(self):
+        rows = [["name", "note", "city"], ["alice", "plain", "paris"], ["bob", "has, comma", "rome"],
+                ["carol", 'has "quote"', "oslo"], ["dave", "two\nlines", "lima"], ["erin"], [], ["frank", "", "", "extra"]]
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path, output_path = os.path.join(tmp, "in.csv"), os.path.join(tmp, "out.csv")
+            with open(input_path, "w", newline="") as f:
+                csv.writer(f).writerows(rows)
+            DataAnonymizer(config={"name": "REDACTED", "city": "null"}).anonymize_csv_stream(input_path, output_path)
+            with open(output_path, newline="") as f:
+                output = f.read()
+        expected = []
+        for row in rows[1:]:
+            if row:
+                row = ["REDACTED"] + row[1:2] + ([""] if len(row) > 2 else []) + row[3:]
+                expected.append(row)
+        with tempfile.TemporaryFile("w+", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(rows[0])
+            writer.writerows(expected)
+            f.seek(0)
+            self.assertEqual(output, f.read())
+
+    def test_rewrites_input_in_place(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.csv")
+            with open(path, "w", newline="") as f:
+                f.write("name,city\nalice,paris\nbob,rome\n")
+            DataAnonymizer(config={"name": "REDACTED"}).anonymize_csv_stream(path, path)
+            with open(path, newline="") as f:
+                self.assertEqual(f.read(), "name,city\r\nREDACTED,paris\r\nREDACTED,rome\r\n")
+
+    def test_csv_error_keeps_existing_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path, output_path = os.path.join(tmp, "in.csv"), os.path.join(tmp, "out.csv")
+            with open(input_path, "w", newline="") as f:
+                f.write("name\nalice\n" + "x" * (csv.field_size_limit() + 1) + "\n")
+            with open(output_path, "w") as f:
+                f.write("previous")
+            with self.assertRaises(csv.Error):
+                DataAnonymizer(config={"name": "REDACTED"}).anonymize_csv_stream(input_path, output_path)
+            with open(output_path) as f:
+                self.assertEqual(f.read(), "previous")
+            self.assertEqual(sorted(os.listdir(tmp)), ["in.csv", "out.csv"])
+
+
+@unittest.skipIf(main.pd is None, "pandas is not installed")
+class AnonymizeCsvPandasTest(unittest.TestCase):
+
+    def test_invalid_randint_rules_are_masking_errors(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "input.csv")
+            output_path = os.path.join(directory, "output.csv")
+            with open(input_path, "w", newline="") as f:
+                f.write("a,b,c,d\n1,2,3,NA\n")
+            config = {"a": "random.randint(5)", "b": "random.randint(10, 1)", "c": "random.randint(1, 3)"}
+            DataAnonymizer(config=config).anonymize_csv_pandas(input_path, output_path)
+            with open(output_path, newline="") as f:
+                rows = list(csv.reader(f))
+        self.assertEqual(rows[1][:2], ["[MASKING_ERROR]", "[MASKING_ERROR]"])
+        self.assertIn(rows[1][2], ["1", "2", "3"])
+        self.assertEqual(rows[1][3], "NA")
+
+
+class AnonymizeXmlTest(unittest.TestCase):
+
+    def test_str_input_ignores_declared_encoding(self):
+        xml = '<?xml version="1.0" encoding="ISO-8859-1"?><root><p>café</p><name>x</name></root>'
+        output = DataAnonymizer(config={"name": "fake.name"}).anonymize_xml(xml)
+        self.assertIn("<p>café</p>", output)
+
+    def stream(self, xml, config=None):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path, output_path = os.path.join(tmp, "in.xml"), os.path.join(tmp, "out.xml")
+            with open(input_path, "w", encoding="utf8") as f:
+                f.write(xml)
+            DataAnonymizer(config=config or {"name": "fake.name"}).anonymize_xml_stream(input_path, output_path)
+            with open(output_path, encoding="utf8") as f:
+                return f.read()
+
+    def test_stream_matches_whole_document(self):
+        xml = "<root>lead<!-- note --><person id='1'><name>a</name><age>3</age></person>\n  <person><name>b</name></person>tail<empty/></root>"
+        config = {"name": "REDACTED", "age": "null"}
+        self.assertEqual(self.stream(xml, config), "<?xml version='1.0' encoding='utf8'?>\n" + DataAnonymizer(config=config).anonymize_xml(xml))
+
+    def test_stream_keeps_text_of_childless_root(self):
+        self.assertTrue(self.stream("<root>a &amp; b</root>").endswith("<root>a &amp; b</root>"))
+
+    @unittest.skipUnless(main._HAVE_LXML, "lxml is not installed")
+    def test_stream_keeps_default_namespace(self):
+        output = self.stream('<root xmlns="urn:a"><p>x</p><p>y</p></root>')
+        self.assertTrue(output.endswith('<root xmlns="urn:a"><p>x</p><p>y</p></root>'))
+
+
+class JsonRoundTripTest(unittest.TestCase):
+
+    def assertRoundTrips(self, document):
+        data, parsed_with_orjson = main._json_loads(document)
+        self.assertEqual(json.loads(main._json_dumps(data, parsed_with_orjson)), json.loads(document))
+        return data
+
+    def test_integers_outside_int64_are_preserved(self):
+        for value in (-9999999999999999999, -9223372036854775809, 9223372036854775808, 12345678901234567890123):
+            with self.subTest(value=value):
+                data = self.assertRoundTrips(b'[{"a": %d}]' % value)
+                self.assertEqual(data[0]["a"], value)
+                self.assertIsInstance(data[0]["a"], int)
+
+    def test_non_finite_numbers_are_preserved(self):
+        data, parsed_with_orjson = main._json_loads(b'{"n": NaN, "i": -Infinity}')
+        self.assertEqual(main._json_dumps(data, parsed_with_orjson), b'{\n  "n": NaN,\n  "i": -Infinity\n}')
+
+    @unittest.skipIf(main.orjson is None, "orjson is not installed")
+    def test_stdlib_fallback_matches_orjson(self):
+        document = b'[{"s": "text", "i": -12, "f": 1.5, "b": true, "n": null, "l": [1, {}], "o": {"e": []}}, "caf\xc3\xa9"]'
+        data, parsed_with_orjson = main._json_loads(document)
+        self.assertTrue(parsed_with_orjson)
+        with_orjson = main._json_dumps(data)
+        with mock.patch.object(main, "orjson", None):
+            fallback_data, parsed_with_orjson = main._json_loads(document)
+            self.assertFalse(parsed_with_orjson)
+            fallback = main._json_dumps(fallback_data)
+        self.assertEqual(fallback_data, data)
+        # The stdlib module escapes non-ASCII characters, so only the ASCII record is compared byte for byte
+        self.assertEqual(fallback.split(b"\n  },")[0], with_orjson.split(b"\n  },")[0])
+        self.assertEqual(json.loads(fallback), json.loads(with_orjson))
+
+
+
+@unittest.skipIf(main.ijson is None, "ijson is not installed")
+class AnonymizeJsonStreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.input_path = os.path.join(self.directory.name, "input.json")
+        self.output_path = os.path.join(self.directory.name, "output.json")
+
+    def test_falls_back_to_whole_file_parse(self):
+        with open(self.input_path, "wb") as f:
+            f.write(b'[{"name": "a", "big": 9223372036854775808}, {"name": "b", "n": NaN}]')
+        DataAnonymizer(config={"name": "fake.name"}).anonymize_json_stream(self.input_path, self.output_path)
+        with open(self.output_path, "rb") as f:
+            output = f.read()
+        self.assertIn(b'"big": 9223372036854775808', output)
+        self.assertIn(b'"n": NaN', output)
+
+    def test_layout_matches_whole_file(self):
+        for document in (b'[{"name": "a", "n": [1, 2.5, {"x": null}], "e": {}}, {"name": "b", "s": "caf\xc3\xa9"}]', b"[]", b"[{}]"):
+            with self.subTest(document=document):
+                with open(self.input_path, "wb") as f:
+                    f.write(document)
+                anonymizer = DataAnonymizer(config={"name": "REDACTED"})
+                anonymizer.anonymize_json_stream(self.input_path, self.output_path)
+                data, parsed_with_orjson = main._json_loads(document)
+                with open(self.output_path, "rb") as f:
+                    self.assertEqual(f.read(), main._json_dumps(anonymizer.anonymize_json(data), parsed_with_orjson))
+
+    def test_invalid_input_keeps_existing_output(self):
+        with open(self.input_path, "wb") as f:
+            f.write(b'[{"name": "a"}, {bad')
+        with open(self.output_path, "wb") as f:
+            f.write(b"previous")
+        with self.assertRaises(json.JSONDecodeError):
+            DataAnonymizer(config={"name": "fake.name"}).anonymize_json_stream(self.input_path, self.output_path)
+        with open(self.output_path, "rb") as f:
+            self.assertEqual(f.read(), b"previous")
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["input.json", "output.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()